@@ -19,6 +19,7 @@ setup(
             'tests',
         )
     ),
+    python_requires='>=3.9',
     install_requires=(
         'attrs',
         'parsel',
@@ -30,8 +31,6 @@ setup(
         'Natural Language :: English',
         'Operating System :: OS Independent',
         'Programming Language :: Python :: 3',
-        'Programming Language :: Python :: 3.6',
-        'Programming Language :: Python :: 3.7',
-        'Programming Language :: Python :: 3.8',
+        'Programming Language :: Python :: 3.9',
     ),
 )
@@ -1,3 +1,6 @@
+import subprocess
+import sys
+
 import pytest
 
 from web_poet.mixins import ResponseShortcutsMixin
@@ -34,6 +37,10 @@ def test_css(my_page):
     assert title == 'All products | Books to Scrape - Sandbox'
 
 
+def test_selector_is_cached(my_page):
+    assert my_page.selector is my_page.selector
+
+
 def test_baseurl(my_page):
     assert my_page.base_url == 'http://books.toscrape.com/index.html'
 
@@ -61,3 +68,8 @@ def test_custom_baseurl():
     assert page.base_url == 'http://example.com/foo/'
     assert page.urljoin("bar") == 'http://example.com/foo/bar'
     assert page.urljoin("http://example.com/1") == "http://example.com/1"
+
+
+def test_parsel_imported_lazily():
+    code = "import sys, web_poet; assert 'parsel' not in sys.modules"
+    subprocess.run([sys.executable, "-c", code], check=True)
@@ -5,3 +5,8 @@ def test_html_response():
     response = ResponseData('url', 'content')
     assert response.url == 'url'
     assert response.html == 'content'
+
+
+def test_html_response_slots():
+    response = ResponseData('url', 'content')
+    assert not hasattr(response, '__dict__')
@@ -1,8 +1,11 @@
+from typing import TYPE_CHECKING
 from urllib.parse import urljoin
 
-import parsel
 from w3lib.html import get_base_url
 
+if TYPE_CHECKING:
+    import parsel
+
 
 class ResponseShortcutsMixin:
     """Common shortcut methods for working with HTML responses.
@@ -23,9 +26,12 @@ class ResponseShortcutsMixin:
         return self.response.html
 
     @property
-    def selector(self) -> parsel.Selector:
+    def selector(self) -> "parsel.Selector":
         """``parsel.Selector`` instance for the HTML Response."""
         if self._cached_selector is None:
+            # parsel pulls in lxml and cssselect; import it only when
+            # a selector is actually needed.
+            import parsel
             self._cached_selector = parsel.Selector(self.html)
 
         return self._cached_selector
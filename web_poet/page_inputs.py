@@ -1,7 +1,7 @@
 import attr
 
 
-@attr.s(auto_attribs=True)
+@attr.s(auto_attribs=True, slots=True)
 class ResponseData:
     """A container for URL and HTML content of a response, downloaded
     directly using an HTTP client.